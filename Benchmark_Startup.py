@@ -0,0 +1,65 @@
+# Startup-time benchmark for Tail_PTU.py
+# Measures how long it takes from launch until the first live plot tick (the first animation update after the window appears),
+# and until the deferred widgets are built, and checks that the headless decoder never loads matplotlib
+# Tail_PTU.py starts reading at the end of the PTU file, so no records are decoded in this run
+
+import os
+import subprocess
+import sys
+import time
+
+# the first live plot tick should happen within this many seconds of launching Tail_PTU.py
+STARTUP_BUDGET_SECONDS = 1.0
+
+# Tail_PTU.py is stopped and the benchmark fails if it hasn't closed by then
+STARTUP_TIMEOUT_SECONDS = STARTUP_BUDGET_SECONDS * 5 + 10
+
+REPO_DIR = os.path.dirname(os.path.abspath(__file__))
+
+HEADLESS_CHECK = "import sys, Decode, ReadFile, Tail_PTU; print('matplotlib' in sys.modules)"
+
+# imports the decoder modules in a fresh interpreter and reports whether matplotlib was loaded
+def checkHeadless():
+    output = subprocess.run([sys.executable, "-c", HEADLESS_CHECK], capture_output=True, text=True, check=True, cwd=REPO_DIR).stdout
+    return output.strip() == "False"
+
+# launches Tail_PTU.py on the PTU file and returns the seconds from launch until each startup event
+def timeStartup(ptu_file):
+    start = time.time()
+    try:
+        output = subprocess.run([sys.executable, os.path.join(REPO_DIR, "Tail_PTU.py"), ptu_file, "--benchmark"], capture_output=True, text=True, check=True, timeout=STARTUP_TIMEOUT_SECONDS).stdout
+    except subprocess.TimeoutExpired:
+        print("ERROR: Tail_PTU.py did not finish starting up within %.1f s." % STARTUP_TIMEOUT_SECONDS)
+        exit(1)
+    except subprocess.CalledProcessError as error:
+        print("ERROR: Tail_PTU.py exited with code %d." % error.returncode)
+        print(error.stderr)
+        exit(1)
+    events = {}
+    for line in output.splitlines():
+        if line.startswith("STARTUP_"):
+            name, timestamp = line.split()
+            events[name] = float(timestamp) - start
+    if "STARTUP_FIRST_TICK" not in events or "STARTUP_WIDGETS" not in events:
+        print("ERROR: Tail_PTU.py exited before the first plot tick and building the widgets.")
+        exit(1)
+    return events
+
+def main(argv):
+    if len(argv) != 2:
+        print("USAGE: Benchmark_Startup.py newFile.ptu")
+        exit(0)
+
+    headless_ok = checkHeadless()
+    print("headless import without matplotlib:", "OK" if headless_ok else "FAILED")
+
+    events = timeStartup(argv[1])
+    first_tick = events["STARTUP_FIRST_TICK"]
+    print("time to first live plot tick: %.3f s (budget %.1f s)" % (first_tick, STARTUP_BUDGET_SECONDS))
+    print("time to widgets built: %.3f s" % events["STARTUP_WIDGETS"])
+
+    if not headless_ok or first_tick > STARTUP_BUDGET_SECONDS:
+        exit(1)
+
+if __name__ == "__main__":
+    main(sys.argv)
@@ -0,0 +1,145 @@
+# Decoding and binning of HydraHarp T3 records
+# Kept free of matplotlib so it can be used headless, without paying for the GUI imports
+
+import struct
+import numpy as np
+from collections import deque
+from Trace import CONVERT_SECONDS, Trace
+from Histogram import Histogram
+
+# channel numbers
+GREEN = 2
+RED = 1
+
+MAX_BUFFER_SIZE = 100096 * 3
+BUFFER_READ = 256
+
+# number of overflows needed before plotting on graph
+# calculation being done is 75 ns * 1023 (number of bits in nsync) * OVERFLOW_MAX
+# this comes out to around 0.1 s per overflow, or 100 ms when OVERFLOW_MAX is 1300
+
+OVERFLOW_SECOND = 13000
+
+# start-up settings, applied before any records are processed
+# the GUI text boxes only show these values once they are built
+START_TRACE_PERIOD_MILLISECONDS = 1000
+START_TRACE_BIN_MILLISECONDS = 1
+START_HIST_BIN_PICOSECONDS = 64
+START_GREEN_RANGE = [5.0, 40.0]
+START_RED_RANGE = [0.0, 75.0]
+
+# split a 32 bit record into its special, channel, dtime and nsync fields
+def decodeRecord(recordData):
+    special = recordData >> 31
+    channel = (recordData >> 25) & 63
+    dtime = (recordData >> 10) & 32767
+    nsync = recordData & 1023
+    return special, channel, dtime, nsync
+
+# reads every new record in the PTU file into the buffer
+def readRecords(inputfile, buffer):
+    while True:
+        recordData = inputfile.read(BUFFER_READ)
+        if not recordData:
+            break
+        # split recordData into a list of 4 bytes in each element, since there's 4 bytes per 32 bit integer
+        for i in range(0, len(recordData), 4):
+            buffer.append(struct.unpack("<I", recordData[i:i+4])[0])
+    return buffer
+
+class Decoder:
+
+    @property
+    def trace(self):
+        return self._trace
+
+    @property
+    def hist(self):
+        return self._hist
+
+    @property
+    def buffer(self):
+        return self._buffer
+
+    # photons counted on each channel in the current frame
+    # unlike the trace lines, these don't include the ones that change_traces() starts each bin with
+    @property
+    def green_count(self):
+        return self._green_count
+
+    @property
+    def red_count(self):
+        return self._red_count
+
+    # bins the records in the buffer into the trace and histogram
+    # returns True once enough overflows have passed to complete a frame, leaving the rest of the buffer for the next one
+    def process(self):
+        trace = self._trace
+        hist = self._hist
+
+        while self._buffer:
+            special, channel, dtime, nsync = decodeRecord(self._buffer.popleft())
+
+            trace_overflow = OVERFLOW_SECOND * trace.bin_size_milliseconds / CONVERT_SECONDS
+            trace._DA_range = [hist._green_range[0]/(self._measDescRes*1e9), hist._green_range[1]/(self._measDescRes*1e9)]
+
+            if special == 1:
+                if channel == 0x3F: # Overflow
+                    # Number of overflows in nsync. If 0, it's an
+                    # old style single overflow
+                    if nsync == 0:
+                        self._ofl += 1
+                    else:
+                        self._ofl += nsync
+                if self._ofl >= trace_overflow * np.prod(trace.period.shape): # once the overflow amount is over a threshold,
+                    return True
+            else: # regular input channel to count 100 ms bins
+                trace_indx = int(self._ofl // trace_overflow)
+                hist_indx = int((dtime * hist.measDescRes * 1e12)//hist.bin_size_picoseconds)-1
+                if int(channel) == GREEN:
+                    self._green_count += 1
+                    trace.green_line[trace_indx] += 1
+                    hist.green_bins[hist_indx] += 1
+                elif int(channel) == RED:
+                    self._red_count += 1
+                    # if in green area (trace._DD_range), put it in fret line. Else put in red line if it isn't
+                    # or if the fret button isn't on true
+                    if (trace._DA_range[0] <= dtime and dtime <= trace._DA_range[1]) and trace._fret_on == True:
+                        trace._fret_line[trace_indx] += 1
+                    else:
+                        trace.red_line[trace_indx] += 1
+                    hist.red_bins[hist_indx] += 1
+
+        return False
+
+    # reset the values and apply the pending trace and histogram sizes for the next frame
+    def next_frame(self):
+        trace = self._trace
+        hist = self._hist
+
+        self._ofl = 0
+        self._green_count = 0
+        self._red_count = 0
+        trace.period_milliseconds = trace.period_milliseconds_next
+        trace.bin_size_milliseconds = trace.bin_size_milliseconds_next
+        if trace.bin_size_milliseconds > trace.period_milliseconds:
+            trace.period_milliseconds = trace.bin_size_milliseconds
+        trace.change_traces()
+        if (hist.bin_size_picoseconds != hist.bin_size_picoseconds_next):
+            hist.bin_size_picoseconds = hist.bin_size_picoseconds_next
+            hist.change_hist()
+
+    def __init__(self, measDescRes):
+        self._measDescRes = measDescRes
+        self._trace = Trace()
+        self._hist = Histogram(measDescRes)
+        self._buffer = deque(maxlen=MAX_BUFFER_SIZE)
+        self._ofl = 0
+        self._green_count = 0
+        self._red_count = 0
+
+        self._trace.period_milliseconds_next = START_TRACE_PERIOD_MILLISECONDS
+        self._trace.bin_size_milliseconds_next = START_TRACE_BIN_MILLISECONDS
+        self._hist.bin_size_picoseconds_next = START_HIST_BIN_PICOSECONDS
+        self._hist._green_range[:] = START_GREEN_RANGE
+        self._hist._red_range[:] = START_RED_RANGE